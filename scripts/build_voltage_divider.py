@@ -17,17 +17,17 @@ from graph.planarity import is_planar_graph
 
 
 class Resistor(BaseComponent):
+    __slots__ = ()
+
+    type = ComponentType.RESISTOR
+    _PIN_NAMES = ("1", "2")
+
     def __init__(self, name: str, resistance_ohm: float):
         super().__init__(
             name=name,
-            pin_names=["1", "2"],
             parameters={"resistance": resistance_ohm},
         )
 
-    @property
-    def type(self) -> ComponentType:
-        return ComponentType.RESISTOR
-
 
 # ─────────────────────────────────────────────
 # Build a voltage divider
@@ -83,11 +83,11 @@ if __name__ == "__main__":
 
     print("\nNets:")
     for net in schematic.nets:
-        print(f"  {net}")
+        print(f"  {net.describe()}")
 
     print("\nComponents:")
     for comp in schematic.components:
-        print(f"  {comp}")
+        print(f"  {comp.describe()}")
         for pin in comp.pins:
             print(f"    {pin}")
 
@@ -3,13 +3,13 @@ from circuit_elements.core.base.component_type import ComponentType
 
 
 class Capacitor(BaseComponent):
+    __slots__ = ()
+
+    type = ComponentType.CAPACITOR
+    _PIN_NAMES = ("1", "2")
+
     def __init__(self, name: str, capacitance_farad: float):
         super().__init__(
             name=name,
-            pin_names=["1", "2"],
             parameters={"capacitance": capacitance_farad},
         )
-
-    @property
-    def type(self) -> ComponentType:
-        return ComponentType.CAPACITOR
@@ -3,13 +3,13 @@ from circuit_elements.core.base.component_type import ComponentType
 
 
 class Inductor(BaseComponent):
+    __slots__ = ()
+
+    type = ComponentType.INDUCTOR
+    _PIN_NAMES = ("1", "2")
+
     def __init__(self, name: str, inductance_henry: float):
         super().__init__(
             name=name,
-            pin_names=["1", "2"],
             parameters={"inductance": inductance_henry},
         )
-
-    @property
-    def type(self) -> ComponentType:
-        return ComponentType.INDUCTOR
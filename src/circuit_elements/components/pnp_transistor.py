@@ -5,13 +5,13 @@ from circuit_elements.core.base.component_type import ComponentType
 
 
 class PNPTransistor(BaseComponent):
+    __slots__ = ()
+
+    type = ComponentType.BJT
+    _PIN_NAMES = ("emitter", "base", "collector")
+
     def __init__(self, name: str, beta: float, part_number: Optional[str]):
         super().__init__(
             name=name,
-            pin_names=["emitter", "base", "collector"],
             parameters={"base_type": "pnp", "beta": beta, "part_number": part_number},
         )
-
-    @property
-    def type(self) -> ComponentType:
-        return ComponentType.BJT
@@ -3,13 +3,13 @@ from circuit_elements.core.base.component_type import ComponentType
 
 
 class PolarizedCapacitor(BaseComponent):
+    __slots__ = ()
+
+    type = ComponentType.CAPACITOR
+    _PIN_NAMES = ("+", "-")
+
     def __init__(self, name: str, capacitance_farad: float):
         super().__init__(
             name=name,
-            pin_names=["+", "-"],
             parameters={"capacitance": capacitance_farad},
         )
-
-    @property
-    def type(self) -> ComponentType:
-        return ComponentType.CAPACITOR
@@ -3,13 +3,13 @@ from circuit_elements.core.base.component_type import ComponentType
 
 
 class Resistor(BaseComponent):
+    __slots__ = ()
+
+    type = ComponentType.RESISTOR
+    _PIN_NAMES = ("1", "2")
+
     def __init__(self, name: str, resistance_ohm: float):
         super().__init__(
             name=name,
-            pin_names=["1", "2"],
             parameters={"resistance": resistance_ohm},
         )
-
-    @property
-    def type(self) -> ComponentType:
-        return ComponentType.RESISTOR
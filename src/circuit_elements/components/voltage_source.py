@@ -5,13 +5,13 @@ from circuit_elements.core.base.component_type import ComponentType
 
 
 class VoltageSource(BaseComponent):
+    __slots__ = ()
+
+    type = ComponentType.VOLTAGE_SOURCE
+    _PIN_NAMES = ("+", "-")
+
     def __init__(self, name: str, voltage: float | Callable):
         super().__init__(
             name=name,
-            pin_names=["+", "-"],
             parameters={"voltage": voltage},
         )
-
-    @property
-    def type(self) -> ComponentType:
-        return ComponentType.VOLTAGE_SOURCE
@@ -1,47 +1,102 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Any, Iterator
+import sys
+from typing import Any, ClassVar, Sequence
 
 from .component_type import ComponentType
 from .net import Net
 from .pin import Pin
 
 
-class BaseComponent(ABC):
+class BaseComponent:
+    __slots__ = ("_pin_lookup", "_pin_names", "_pin_nets", "name", "parameters")
+
+    # Set by every concrete component as a plain class attribute
+    type: ClassVar[ComponentType]
+
+    # Fixed pin layout shared by every instance of a concrete component class,
+    # validated once at class creation
+    _PIN_NAMES: ClassVar[tuple[str, ...]] = ()
+    _PIN_LOOKUP: ClassVar[dict[int | str, int]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, "type", None) is None:
+            raise TypeError(f"{cls.__name__} must define a class-level 'type'")
+        if "_PIN_NAMES" in cls.__dict__:
+            cls._PIN_NAMES, cls._PIN_LOOKUP = _build_pin_table(
+                tuple(sys.intern(pn) for pn in cls._PIN_NAMES)
+            )
+
     def __init__(
         self,
         name: str,
-        pin_names: list[str],
+        pin_names: Sequence[str] | None = None,
         parameters: dict[str, Any] | None = None,
     ) -> None:
-        if not pin_names:
-            raise ValueError("Component must have at least one pin")
+        # Struct-of-arrays pin storage: pin i is (_pin_names[i], _pin_nets[i])
+        if pin_names is None:
+            # Fast path: reuse the class-level layout, no per-instance validation
+            if not self._PIN_NAMES:
+                raise ValueError("Component must have at least one pin")
+            self._pin_names: tuple[str, ...] = self._PIN_NAMES
+            self._pin_lookup: dict[int | str, int] = self._PIN_LOOKUP
+        else:
+            self._pin_names, self._pin_lookup = _build_pin_table(tuple(pin_names))
 
         self.name = name
         self.parameters = parameters or {}
+        self._pin_nets: list[Net | None] = [None] * len(self._pin_names)
 
-        self.pins: list[Pin] = [Pin(i, pn) for i, pn in enumerate(pin_names)]
-        self._pin_by_name: dict[str, Pin] = {p.name: p for p in self.pins}
+    @property
+    def pin_names(self) -> tuple[str, ...]:
+        return self._pin_names
 
-        if len(self._pin_by_name) != len(self.pins):
-            raise ValueError("Duplicate pin names are not allowed")
+    @property
+    def pins(self) -> tuple[Pin, ...]:
+        return tuple(Pin(self, i) for i in range(len(self._pin_names)))
 
     def pin(self, name: str) -> Pin:
+        return Pin(self, self.pin_index(name))
+
+    def pin_index(self, pin: int | str) -> int:
+        # The lookup table holds both pin names and valid indices, so the common
+        # case is a single dict hit with no type dispatch or bounds check
         try:
-            return self._pin_by_name[name]
+            return self._pin_lookup[pin]
         except KeyError:
-            raise KeyError(f"Component {self.name} has no pin named '{name}'")
-
-    @property
-    @abstractmethod
-    def type(self) -> ComponentType: ...
+            if isinstance(pin, str):
+                raise KeyError(f"Component {self.name} has no pin named '{pin}'")
+            raise IndexError(f"Pin index {pin} out of range for {self.name}")
 
-    def connected_nets(self) -> Iterator[Net]:
-        return (p.net for p in self.pins if p.net is not None)
+    def connected_nets(self) -> frozenset[Net]:
+        """Distinct nets this component touches (a net shared by two pins appears once)."""
+        return frozenset(n for n in self._pin_nets if n is not None)
 
-    def __repr__(self) -> str:
+    def describe(self) -> str:
+        """Verbose form of repr() including the net attached to every pin."""
         pin_state = ", ".join(
-            f"{p.index}:{p.net.name if p.net else 'NC'}" for p in self.pins
+            f"{i}:{n.name if n else 'NC'}" for i, n in enumerate(self._pin_nets)
         )
         return f"<{self.__class__.__name__} {self.name} [{pin_state}]>"
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name}>"
+
+
+def _build_pin_table(
+    pin_names: tuple[str, ...],
+) -> tuple[tuple[str, ...], dict[int | str, int]]:
+    """
+    Validate a pin layout and build its resolver table, mapping every pin name
+    and every valid pin index to the pin index.
+    """
+    if not pin_names:
+        raise ValueError("Component must have at least one pin")
+
+    lookup: dict[int | str, int] = {pn: i for i, pn in enumerate(pin_names)}
+    if len(lookup) != len(pin_names):
+        raise ValueError("Duplicate pin names are not allowed")
+
+    lookup.update((i, i) for i in range(len(pin_names)))
+    return pin_names, lookup
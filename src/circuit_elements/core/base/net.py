@@ -1,9 +1,21 @@
 from __future__ import annotations
 
-from typing import Any
+from array import array
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping
 
 
 class Net:
+    __slots__ = (
+        "_comps",
+        "_connections_view",
+        "_degree",
+        "_pin_idx",
+        "is_ground",
+        "metadata",
+        "name",
+    )
+
     def __init__(
         self,
         name: str,
@@ -13,21 +25,29 @@ class Net:
         self.name = name
         self.is_ground = is_ground
         self.metadata = metadata or {}
-        self._connections: dict[Any, set[int]] = {}
+
+        # CSR-style incidence storage: incidence i is (_comps[i], _pin_idx[i])
+        self._comps: list[Any] = []
+        self._pin_idx: array[int] = array("i")
+        self._degree = 0
+
+        # Grouped read-only view built by `connections`; reset on every mutation
+        self._connections_view: Mapping[Any, frozenset[int]] | None = None
 
     def connect(self, component: Any, pin: int | str) -> None:
-        if isinstance(pin, str):
-            p = component.pin(pin)
-        else:
-            if not (0 <= pin < len(component.pins)):
-                raise IndexError(f"Pin index {pin} out of range for {component.name}")
-            p = component.pins[pin]
+        idx = component.pin_index(pin)
 
-        if p.net is not None:
-            raise ValueError(f"Pin {p.name} already connected to net {p.net.name}")
+        current = component._pin_nets[idx]
+        if current is not None:
+            raise ValueError(
+                f"Pin {component._pin_names[idx]} already connected to net {current.name}"
+            )
 
-        self._connections.setdefault(component, set()).add(p.index)
-        p.net = self
+        self._comps.append(component)
+        self._pin_idx.append(idx)
+        self._degree += 1
+        self._connections_view = None
+        component._pin_nets[idx] = self
 
     def __iadd__(self, other):
         try:
@@ -37,14 +57,29 @@ class Net:
         self.connect(component, pin)
         return self
 
+    def iter_connections(self) -> Iterator[tuple[Any, int]]:
+        """Yield (component, pin_index) incidences straight from the arrays."""
+        return zip(self._comps, self._pin_idx)
+
     @property
-    def connections(self) -> dict[Any, set[int]]:
-        return {c: frozenset(p) for c, p in self._connections.items()}
+    def connections(self) -> Mapping[Any, frozenset[int]]:
+        view = self._connections_view
+        if view is None:
+            grouped: dict[Any, set[int]] = {}
+            for c, idx in zip(self._comps, self._pin_idx):
+                grouped.setdefault(c, set()).add(idx)
+            view = MappingProxyType({c: frozenset(p) for c, p in grouped.items()})
+            self._connections_view = view
+        return view
 
     @property
     def degree(self) -> int:
-        return sum(len(p) for p in self._connections.values())
+        return self._degree
 
-    def __repr__(self) -> str:
-        conns = ", ".join(f"{c.name}:{sorted(p)}" for c, p in self._connections.items())
+    def describe(self) -> str:
+        """Verbose form of repr() listing every connected component and its pins."""
+        conns = ", ".join(f"{c.name}:{sorted(p)}" for c, p in self.connections.items())
         return f"<Net {self.name} degree={self.degree} [{conns}]>"
+
+    def __repr__(self) -> str:
+        return f"<Net {self.name} degree={self.degree}>"
@@ -1,13 +1,34 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
 from .net import Net
 
+if TYPE_CHECKING:
+    from .base_component import BaseComponent
+
 
+@dataclass(frozen=True, slots=True, repr=False)
 class Pin:
-    def __init__(self, index: int, name: str | None = None):
-        self.index = index
-        self.name = name
-        self.net: Net | None = None
+    """
+    Lightweight view of one pin of a component.
+
+    Pin state lives in the owning component's parallel arrays; a Pin is only
+    materialized on demand by `BaseComponent.pin()` / `BaseComponent.pins`.
+    """
+
+    component: BaseComponent
+    index: int
+
+    @property
+    def name(self) -> str:
+        return self.component._pin_names[self.index]
+
+    @property
+    def net(self) -> Net | None:
+        return self.component._pin_nets[self.index]
 
     def __repr__(self) -> str:
-        return f"<Pin {self.name} -> {self.net.name if self.net else 'NC'}>"
+        net = self.net
+        return f"<Pin {self.name} -> {net.name if net else 'NC'}>"
@@ -1,3 +1,4 @@
+from itertools import count
 from typing import Optional, Union
 
 from .base_component import BaseComponent
@@ -10,7 +11,7 @@ class Schematic:
         self._components: dict[str, BaseComponent] = {}
         self._frozen = False
 
-        self._anon_net_counter = 0
+        self._anon_net_counter = count(1)
 
     @property
     def nets(self):
@@ -36,8 +37,7 @@ class Schematic:
         raise TypeError("component must be a name (str) or BaseComponent")
 
     def _new_auto_net_name(self) -> str:
-        self._anon_net_counter += 1
-        return f"N${self._anon_net_counter}"
+        return f"N${next(self._anon_net_counter)}"
 
     def _merge_nets(self, net_target: Net, net_source: Net) -> None:
         if self._frozen:
@@ -46,17 +46,15 @@ class Schematic:
         if net_target is net_source:
             return
 
-        # Move all connections from source to target
-        for component, pin_set in list(net_source._connections.items()):
-            for pin_idx in pin_set:
-                pin = component.pins[pin_idx]
+        # Move all connections from source to target WITHOUT using Net.connect():
+        # bulk-append the incidence arrays, then repoint every moved pin
+        net_target._comps.extend(net_source._comps)
+        net_target._pin_idx.extend(net_source._pin_idx)
+        net_target._degree += net_source._degree
+        net_target._connections_view = None
 
-                # REMOVE pin from source net
-                pin.net = None
-
-                # ADD pin to target net WITHOUT using Net.connect()
-                net_target._connections.setdefault(component, set()).add(pin_idx)
-                pin.net = net_target
+        for component, pin_idx in zip(net_source._comps, net_source._pin_idx):
+            component._pin_nets[pin_idx] = net_target
 
         # Remove source net from schematic registry
         del self._nets[net_source.name]
@@ -97,9 +95,12 @@ class Schematic:
     def connect_create_net(self, net_name: str, component: str, pin: int | str) -> None:
         if self._frozen:
             raise RuntimeError("Schematic is frozen")
-        if net_name not in self._nets:
-            self.add_net(Net(net_name))
-        self.connect(net_name, component, pin)
+        comp = self.component(component)
+
+        net = self._nets.get(net_name)
+        if net is None:
+            net = self._nets[net_name] = Net(net_name)
+        net.connect(comp, pin)
 
     def connect_pins(
         self,
@@ -126,11 +127,11 @@ class Schematic:
         a = self._resolve_component(comp_a)
         b = self._resolve_component(comp_b)
 
-        p_a = a.pin(pin_a) if isinstance(pin_a, str) else a.pins[pin_a]
-        p_b = b.pin(pin_b) if isinstance(pin_b, str) else b.pins[pin_b]
+        idx_a = a.pin_index(pin_a)
+        idx_b = b.pin_index(pin_b)
 
-        net_a = p_a.net
-        net_b = p_b.net
+        net_a = a._pin_nets[idx_a]
+        net_b = b._pin_nets[idx_b]
 
         # Case: both unconnected -> create new net
         if net_a is None and net_b is None:
@@ -140,16 +141,16 @@ class Schematic:
             else:
                 net = Net(chosen_name)
                 self.add_net(net)
-            net.connect(a, p_a.index)
-            net.connect(b, p_b.index)
+            net.connect(a, idx_a)
+            net.connect(b, idx_b)
             return net
 
         # Case: one side connected -> attach other
         if net_a is not None and net_b is None:
-            net_a.connect(b, p_b.index)
+            net_a.connect(b, idx_b)
             return net_a
         if net_b is not None and net_a is None:
-            net_b.connect(a, p_a.index)
+            net_b.connect(a, idx_a)
             return net_b
 
         # Case: both connected
@@ -180,8 +181,9 @@ class Schematic:
 
     def validate(self) -> None:
         for c in self._components.values():
-            for p in c.pins:
-                if p.net is None:
-                    raise ValueError(
-                        f"Component {c.name} has unconnected pin '{p.name}'"
-                    )
+            # C-level scan on the (common) valid path; locate the pin only on failure
+            if None in c._pin_nets:
+                idx = c._pin_nets.index(None)
+                raise ValueError(
+                    f"Component {c.name} has unconnected pin '{c._pin_names[idx]}'"
+                )
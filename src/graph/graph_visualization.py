@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
-import matplotlib.pyplot as plt
-import networkx as nx
+if TYPE_CHECKING:
+    import networkx as nx
 
 
 def save_graph_visualization(
@@ -15,6 +15,11 @@ def save_graph_visualization(
     font_size: int = 10,
     save_path: Optional[str] = None,
 ) -> None:
+    # Deferred: importing matplotlib costs font-cache scanning and backend setup,
+    # which callers that only import the graph package should not pay for
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     if layout is None:
         layout = nx.spring_layout
 
@@ -1,7 +1,8 @@
-from itertools import combinations
-from typing import Iterable
+from itertools import chain, combinations
+from typing import Iterable, Tuple
 
 import networkx as nx
+import numpy as np
 
 
 def build_bipartite_graph_from_vertices(vertices: Iterable) -> nx.MultiGraph:
@@ -26,17 +27,24 @@ def build_bipartite_graph_from_vertices(vertices: Iterable) -> nx.MultiGraph:
                 graph.add_node(comp_id, kind="component", obj=comp)
             for pin_idx in pin_set:
                 graph.add_edge(
-                    net_id, comp_id, pin_index=int(pin_idx), net_obj=net, comp_obj=comp
+                    net_id, comp_id, pin_index=pin_idx, net_obj=net, comp_obj=comp
                 )
     return graph
 
 
-def build_net_multigraph_from_vertices(vertices: Iterable) -> nx.MultiGraph:
+def build_net_multigraph_from_vertices(
+    vertices: Iterable, *, include_pin_label: bool = False
+) -> nx.MultiGraph:
     """
     Build a projected MultiGraph on nets (nodes = net.name).
     For each component, emit an edge for every unordered pair of *distinct* nets it touches.
     Edge attributes: component (object), component_name (str), nets (tuple of names), pin_map (mapping).
+
+    With include_pin_label=True edges also carry pin_label (str, pin_map rendered
+    as "net:pins; net:pins" ordered by net name), ready for drawing.
     """
+    vertices = list(vertices)
+
     multi_graph = nx.MultiGraph()
     # ensure all nets are nodes (so isolated nets appear)
     for net in vertices:
@@ -53,18 +61,23 @@ def build_net_multigraph_from_vertices(vertices: Iterable) -> nx.MultiGraph:
 
     # For each component, create edges between every unordered pair of nets it touches
     for comp, net_map in comp_to_nets.items():
-        nets = list(net_map.keys())
-        if len(nets) < 2:
+        if len(net_map) < 2:
             continue
         comp_name = getattr(comp, "name", comp)
-        for a, b in combinations(nets, 2):
+        if include_pin_label:
+            # "net:pins" text per net, shared by every pair this component emits
+            pin_text = {
+                net: f"{getattr(net, 'name', net)}:{','.join(map(str, sorted(pins)))}"
+                for net, pins in net_map.items()
+            }
+        for a, b in combinations(net_map, 2):
             a_id, b_id = getattr(a, "name", a), getattr(b, "name", b)
             # pin map for this particular pair (useful metadata)
             pin_map = {
                 a_id: frozenset(net_map[a]),
                 b_id: frozenset(net_map[b]),
             }
-            multi_graph.add_edge(
+            key = multi_graph.add_edge(
                 a_id,
                 b_id,
                 component=comp,
@@ -72,4 +85,77 @@ def build_net_multigraph_from_vertices(vertices: Iterable) -> nx.MultiGraph:
                 nets=(a_id, b_id),
                 pin_map=pin_map,
             )
+            if include_pin_label:
+                # ready-to-render pin map text, ordered by net name for determinism
+                multi_graph[a_id][b_id][key]["pin_label"] = (
+                    f"{pin_text[a]}; {pin_text[b]}"
+                    if str(a_id) <= str(b_id)
+                    else f"{pin_text[b]}; {pin_text[a]}"
+                )
     return multi_graph
+
+
+def _net_pair_ids(
+    comp_offsets: np.ndarray, comp_net_ids: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Emit every unordered pair of net ids touched by each component.
+
+    Components are given in CSR form: the nets of component c are
+    comp_net_ids[comp_offsets[c]:comp_offsets[c + 1]]. Components with the same
+    net count are processed together as one (m, k) block, so the work per block
+    is a single fancy-indexing operation instead of a Python loop per pair.
+    """
+    counts = np.diff(comp_offsets)
+    a_parts, b_parts = [], []
+    for k in np.unique(counts):
+        if k < 2:
+            continue
+        starts = comp_offsets[:-1][counts == k]
+        block = comp_net_ids[starts[:, None] + np.arange(k)]
+        iu, ju = np.triu_indices(k, 1)
+        a_parts.append(block[:, iu].ravel())
+        b_parts.append(block[:, ju].ravel())
+
+    if not a_parts:
+        empty = np.empty(0, dtype=np.int32)
+        return empty, empty
+    return np.concatenate(a_parts), np.concatenate(b_parts)
+
+
+def build_net_graph_from_vertices(vertices: Iterable) -> nx.Graph:
+    """
+    Build a plain Graph on nets (nodes = net.name), with an edge between every pair
+    of distinct nets that share at least one component.
+
+    Attribute-free counterpart of build_net_multigraph_from_vertices for purely
+    structural queries (e.g. planarity): parallel components collapse into a
+    single edge and no per-edge metadata is built.
+    """
+    vertices = list(vertices)
+    net_ids = [getattr(net, "name", net) for net in vertices]
+
+    graph = nx.Graph()
+    graph.add_nodes_from(
+        (net_id, {"obj": net, "is_ground": getattr(net, "is_ground", False)})
+        for net_id, net in zip(net_ids, vertices)
+    )
+
+    # component -> indices of the nets it touches, remapped to CSR int arrays
+    comp_to_nets = {}
+    for i, net in enumerate(vertices):
+        for comp in net.connections:
+            comp_to_nets.setdefault(comp, []).append(i)
+
+    net_lists = list(comp_to_nets.values())
+    comp_offsets = np.zeros(len(net_lists) + 1, dtype=np.int64)
+    np.cumsum([len(nets) for nets in net_lists], out=comp_offsets[1:])
+    comp_net_ids = np.fromiter(
+        chain.from_iterable(net_lists), dtype=np.int32, count=int(comp_offsets[-1])
+    )
+
+    a_ids, b_ids = _net_pair_ids(comp_offsets, comp_net_ids)
+    graph.add_edges_from(
+        (net_ids[a], net_ids[b]) for a, b in zip(a_ids.tolist(), b_ids.tolist())
+    )
+    return graph
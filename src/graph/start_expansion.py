@@ -1,8 +1,63 @@
 from __future__ import annotations
 
-from typing import Iterable, Iterator, List
+from typing import Dict, Iterable, Iterator, List, Tuple
 
-from graph.protocols import Incidence, VertexLike
+import numpy as np
+
+from graph.protocols import HyperedgeLike, Incidence, VertexLike
+
+
+def star_expansion_arrays(
+    vertices: Iterable[VertexLike],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[VertexLike], List[HyperedgeLike]]:
+    """
+    Columnar variant of the star expansion.
+
+    Returns (vertex_idx, hyperedge_idx, pin_idx, vertex_list, hyperedge_list):
+    three parallel int32 arrays with one entry per pin incidence, plus the lookup
+    tables mapping vertex/hyperedge ids back to the original objects.
+    """
+    vertex_list: List[VertexLike] = list(vertices)
+    he_list: List[HyperedgeLike] = []
+    he_to_id: Dict[HyperedgeLike, int] = {}
+
+    # first pass: snapshot connections, assign hyperedge ids and count incidences
+    conns = [v.connections for v in vertex_list]
+    n_total = 0
+    for conn in conns:
+        for he, pin_indices in conn.items():
+            if he not in he_to_id:
+                he_to_id[he] = len(he_list)
+                he_list.append(he)
+            n_total += len(pin_indices)
+
+    # second pass: fill preallocated columns
+    v_idx = np.fromiter(
+        (
+            vid
+            for vid, conn in enumerate(conns)
+            for pin_indices in conn.values()
+            for _ in pin_indices
+        ),
+        dtype=np.int32,
+        count=n_total,
+    )
+    he_idx = np.fromiter(
+        (
+            he_to_id[he]
+            for conn in conns
+            for he, pin_indices in conn.items()
+            for _ in pin_indices
+        ),
+        dtype=np.int32,
+        count=n_total,
+    )
+    pin_idx = np.fromiter(
+        (pin for conn in conns for pin_indices in conn.values() for pin in pin_indices),
+        dtype=np.int32,
+        count=n_total,
+    )
+    return v_idx, he_idx, pin_idx, vertex_list, he_list
 
 
 def star_expansion_from_vertices(vertices: Iterable[VertexLike]) -> List[Incidence]:
@@ -15,7 +70,7 @@ def star_expansion_from_vertices(vertices: Iterable[VertexLike]) -> List[Inciden
     for v in vertices:
         for he, pin_indices in v.connections.items():
             for pin_idx in pin_indices:
-                incidences.append((v, he, int(pin_idx)))
+                incidences.append((v, he, pin_idx))
     return incidences
 
 
@@ -27,4 +82,4 @@ def star_expansion_iter(vertices: Iterable[VertexLike]) -> Iterator[Incidence]:
     for v in vertices:
         for he, pin_indices in v.connections.items():
             for pin_idx in pin_indices:
-                yield (v, he, int(pin_idx))
+                yield (v, he, pin_idx)
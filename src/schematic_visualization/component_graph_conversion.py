@@ -1,11 +1,29 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Mapping, Set, Tuple
+from itertools import count
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Sized, Tuple
 
 import networkx as nx
 
+from graph.protocols import VertexLike
 
-def collect_comp_net_info(vertices: Iterable) -> Dict[Any, Dict[str, Set[int]]]:
+
+def _vertex_name_and_connections(v: VertexLike) -> Tuple[str, Mapping]:
+    # Net objects always carry both attributes: read them directly and only
+    # fall back to the lenient getattr() path for other vertex-like objects
+    try:
+        net_name, conns = v.name, v.connections
+    except AttributeError:
+        net_name = getattr(v, "name", None)
+        conns = getattr(v, "connections", {})
+    if net_name is None:
+        raise ValueError("Vertex missing 'name' attribute")
+    return net_name, conns
+
+
+def collect_comp_net_info(
+    vertices: Iterable[VertexLike],
+) -> Dict[Any, Dict[str, Set[int]]]:
     """
     Traverse vertex-like objects and return a mapping:
         component_obj -> { net_name -> set(pin_indices) }
@@ -14,28 +32,60 @@ def collect_comp_net_info(vertices: Iterable) -> Dict[Any, Dict[str, Set[int]]]:
       - vertex.name : str
       - vertex.connections : Mapping[component_obj -> Iterable[int]]
     """
+    # nothing to collect (e.g. a schematic still being assembled)
+    if isinstance(vertices, Sized) and not vertices:
+        return {}
+
     comp_to_net_info: Dict[Any, Dict[str, Set[int]]] = {}
     for v in vertices:
-        net_name = getattr(v, "name", None)
-        if net_name is None:
-            raise ValueError("Vertex missing 'name' attribute")
-
-        conns: Mapping = getattr(v, "connections", {})
+        net_name, conns = _vertex_name_and_connections(v)
+        if not conns:
+            continue
         for comp, pin_indices in conns.items():
-            comp_entry = comp_to_net_info.setdefault(comp, {})
-            pins = comp_entry.setdefault(net_name, set())
-            for idx in pin_indices:
-                pins.add(int(idx))
+            net_map = comp_to_net_info.get(comp)
+            if net_map is None:
+                net_map = comp_to_net_info[comp] = {}
+            pins = net_map.get(net_name)
+            if pins is None:
+                pins = net_map[net_name] = set()
+            # int() normalizes int-like indices (e.g. numpy ints); map() keeps
+            # the per-index loop in C
+            pins.update(map(int, pin_indices))
     return comp_to_net_info
 
 
+def _pin_name_table(comp: Any) -> Tuple[str, ...]:
+    """Resolve every pin name of a component once (index string if unnamed)."""
+    # BaseComponent keeps its pin names as a ready-made tuple
+    names = getattr(comp, "pin_names", None)
+    if type(names) is tuple:
+        return names
+
+    if not hasattr(comp, "pins"):
+        raise ValueError(
+            f"Component '{getattr(comp, 'name', comp)}' missing 'pins' attribute"
+        )
+    names = []
+    for idx, pin_obj in enumerate(getattr(comp, "pins")):
+        pin_name = getattr(pin_obj, "name", None)
+        if pin_name is None:
+            # fallback to index string
+            pin_name = str(idx)
+        elif type(pin_name) is not str:
+            # pin names are plain str in practice; only coerce when they are not
+            pin_name = str(pin_name)
+        names.append(pin_name)
+    return tuple(names)
+
+
 def convert_indices_to_pin_names(
     comp_to_net_info: Dict[Any, Dict[str, Set[int]]],
 ) -> Dict[Any, Dict[str, List[str]]]:
     """
     Convert pin indices to pin names.
 
-    Expects each component object to have:
+    Expects each component object to have either:
+      - .pin_names : tuple of pin names (as on BaseComponent), or
       - .pins : sequence where .pins[index].name is available
 
     Returns:
@@ -43,91 +93,162 @@ def convert_indices_to_pin_names(
     """
     comp_to_net_pin_names: Dict[Any, Dict[str, List[str]]] = {}
     for comp, net_map in comp_to_net_info.items():
-        if not hasattr(comp, "pins"):
-            raise ValueError(
-                f"Component '{getattr(comp, 'name', comp)}' missing 'pins' attribute"
-            )
-        pins_list = getattr(comp, "pins")
+        table = _pin_name_table(comp)
+        n_pins = len(table)
         comp_pin_map: Dict[str, List[str]] = {}
         for net_name, index_set in net_map.items():
             names: List[str] = []
-            for idx in sorted(index_set):
-                if not (0 <= idx < len(pins_list)):
+            # most (component, net) pairs hold a single pin: skip the sort call
+            for idx in sorted(index_set) if len(index_set) > 1 else index_set:
+                if not (0 <= idx < n_pins):
                     raise IndexError(
                         f"Pin index {idx} out of range for component {getattr(comp, 'name', comp)}"
                     )
-                pin_obj = pins_list[idx]
-                pin_name = getattr(pin_obj, "name", None)
-                if pin_name is None:
-                    # fallback to index string
-                    pin_name = str(idx)
-                names.append(str(pin_name))
+                names.append(table[idx])
             comp_pin_map[net_name] = names
         comp_to_net_pin_names[comp] = comp_pin_map
     return comp_to_net_pin_names
 
 
+def build_component_views(
+    vertices: Iterable[VertexLike],
+) -> Tuple[Dict[Any, Dict[str, List[str]]], Dict[str, Dict[Any, List[str]]]]:
+    """
+    Single-pass equivalent of collect_comp_net_info + convert_indices_to_pin_names
+    that also builds the inverse net view.
+
+    Returns (comp_to_net_pin_names, net_to_comp_pinmap):
+      component_obj -> { net_name -> [pin_name, ...] }
+      net_name -> { component_obj -> [pin_name, ...] }
+
+    Both views share the same pin-name lists.
+    """
+    comp_to_net_pin_names: Dict[Any, Dict[str, List[str]]] = {}
+    net_to_comp_pinmap: Dict[str, Dict[Any, List[str]]] = {}
+    pin_tables: Dict[Any, Tuple[str, ...]] = {}
+
+    for v in vertices:
+        net_name, conns = _vertex_name_and_connections(v)
+        comp_pinmap = net_to_comp_pinmap.setdefault(net_name, {})
+        for comp, pin_indices in conns.items():
+            table = pin_tables.get(comp)
+            if table is None:
+                table = pin_tables[comp] = _pin_name_table(comp)
+
+            names = comp_pinmap.get(comp)
+            if names is None:
+                names = comp_pinmap[comp] = []
+                comp_to_net_pin_names.setdefault(comp, {})[net_name] = names
+
+            ordered = (
+                sorted(map(int, pin_indices))
+                if len(pin_indices) > 1
+                else map(int, pin_indices)
+            )
+            for idx in ordered:
+                if not (0 <= idx < len(table)):
+                    raise IndexError(
+                        f"Pin index {idx} out of range for component {getattr(comp, 'name', comp)}"
+                    )
+                if table[idx] not in names:
+                    names.append(table[idx])
+
+    return comp_to_net_pin_names, net_to_comp_pinmap
+
+
+def _build_component_index_views(
+    vertices: Iterable[VertexLike],
+) -> Tuple[Dict[Any, Dict[str, List[int]]], Dict[str, Dict[Any, List[int]]]]:
+    """
+    Same shape as build_component_views, but with sorted pin indices instead of
+    pin names (no pin-object lookups at all).
+    """
+    comp_to_net_pins: Dict[Any, Dict[str, List[int]]] = {}
+    net_to_comp_pinmap: Dict[str, Dict[Any, List[int]]] = {}
+    for v in vertices:
+        net_name, conns = _vertex_name_and_connections(v)
+        comp_pinmap = net_to_comp_pinmap.setdefault(net_name, {})
+        for comp, pin_indices in conns.items():
+            indices = comp_pinmap.get(comp)
+            if indices is None:
+                indices = comp_pinmap[comp] = []
+                comp_to_net_pins.setdefault(comp, {})[net_name] = indices
+            indices.extend(map(int, pin_indices))
+            if len(indices) > 1:
+                indices[:] = sorted(set(indices))
+    return comp_to_net_pins, net_to_comp_pinmap
+
+
 def build_component_centric_graph(
     vertices: Iterable,
+    *,
+    include_pin_names: bool = True,
 ) -> nx.MultiGraph:
     """
     Build a component-centric MultiGraph using *strict star expansion*.
 
-    Nodes:
+    Nodes (integer ids; display names are in the 'label' attribute and
+    G.graph["node_id"] maps component names / "__NET__:<net>" to ids, keeping
+    the first id when several components share a name):
       - component nodes
       - net hub nodes (one per net)
 
     Edges:
       - component <-> net hub
       - each edge represents exactly one (component, net) incidence
-    """
-    comp_to_net_info = collect_comp_net_info(vertices)
-    comp_to_pin_names = convert_indices_to_pin_names(comp_to_net_info)
-
-    # net_name -> { component -> [pin_names] }
-    net_to_comp_pinmap: Dict[str, Dict[Any, List[str]]] = {}
-
-    for comp, net_map in comp_to_pin_names.items():
-        for net_name, pin_names in net_map.items():
-            net_to_comp_pinmap.setdefault(net_name, {})[comp] = list(pin_names)
 
-    G = nx.MultiGraph()
-
-    # add component nodes
-    for comp in comp_to_net_info.keys():
-        comp_name = getattr(comp, "name", str(comp))
-        G.add_node(
-            comp_name,
-            label=comp_name,
-            kind="component",
-            meta={"obj": comp},
-        )
-
-    # add net hubs and incidence edges
+    With include_pin_names=False the pin-name resolution pass is skipped and
+    edge pin maps hold sorted pin indices (ints) instead of pin names.
+    """
+    if include_pin_names:
+        comp_to_pin_names, net_to_comp_pinmap = build_component_views(vertices)
+    else:
+        comp_to_pin_names, net_to_comp_pinmap = _build_component_index_views(vertices)
+
+    # resolve each component's display name once, not once per incident edge
+    # (str(comp) is only computed for components without a name)
+    comp_name_of = {}
+    for comp in comp_to_pin_names:
+        comp_name = getattr(comp, "name", None)
+        comp_name_of[comp] = str(comp) if comp_name is None else comp_name
+
+    # Nodes are keyed by small ints (cheap to hash in NetworkX's dicts) handed
+    # out per component object / net hub, so same-named components stay
+    # distinct nodes. The display string lives in the 'label' attribute and
+    # G.graph["node_id"] maps component names / "__NET__:<net>" hub names back
+    # to node ids; it is lossy for duplicate names (the first id wins).
+    next_id = count()
+    node_id: Dict[str, int] = {}
+    comp_id_of: Dict[Any, int] = {}
+    G = nx.MultiGraph(node_id=node_id)
+
+    # component nodes
+    for comp, comp_name in comp_name_of.items():
+        nid = comp_id_of[comp] = next(next_id)
+        node_id.setdefault(comp_name, nid)
+        G.add_node(nid, label=comp_name, kind="component", meta={"obj": comp})
+
+    # net hubs and incidence edges
     for net_name, comp_pinmap in net_to_comp_pinmap.items():
-        comps = list(comp_pinmap.keys())
-
-        if not comps:
+        if not comp_pinmap:
             continue
 
-        hub_name = f"__NET__:{net_name}"
-        G.add_node(
-            hub_name,
-            label=net_name,
-            kind="net",
-            meta={"net": net_name},
-        )
+        hub_id = next(next_id)
+        node_id.setdefault(f"__NET__:{net_name}", hub_id)
+        G.add_node(hub_id, label=net_name, kind="net", meta={"net": net_name})
 
+        # The pin-name lists come from build_component_views and are not used
+        # after this loop, so edges take ownership instead of copying them.
+        # Edge keys are left to NetworkX so parallel edges never overwrite
         for comp, pin_names in comp_pinmap.items():
-            comp_name = getattr(comp, "name", str(comp))
             G.add_edge(
-                hub_name,
-                comp_name,
+                hub_id,
+                comp_id_of[comp],
                 label=net_name,
                 kind="net",
                 meta={
                     "nets": [net_name],
-                    "pin_map": {comp_name: list(pin_names)},
+                    "pin_map": {comp_name_of[comp]: pin_names},
                 },
             )
 
@@ -163,36 +284,107 @@ def normalize_graph_contract(G: nx.Graph) -> nx.Graph:
 
     The function mutates and returns the same graph.
     """
-    # nodes
+    # nodes: collect only the missing defaults, then apply them in one call
+    node_defaults = {}
     for n, data in G.nodes(data=True):
+        missing = {}
         if "label" not in data:
-            data["label"] = str(n)
+            missing["label"] = str(n)
         if "kind" not in data:
-            data["kind"] = "node"
+            missing["kind"] = "node"
         if "meta" not in data:
-            data["meta"] = {}
+            missing["meta"] = {}
+        if missing:
+            node_defaults[n] = missing
+    if node_defaults:
+        nx.set_node_attributes(G, node_defaults)
+
+    # edges: key by (u, v, k) on multigraphs and (u, v) otherwise, decided once
+    if G.is_multigraph():
+        edge_items = (
+            ((u, v, k), data) for u, v, k, data in G.edges(keys=True, data=True)
+        )
+    else:
+        edge_items = (((u, v), data) for u, v, data in G.edges(data=True))
 
-    # edges
-    for u, v, k, data in _iter_edges_with_data(G):
-        if "meta" not in data or data["meta"] is None:
-            data["meta"] = {}
-        if "label" not in data:
-            # try to derive from meta['nets'] if present
-            meta = data["meta"]
-            nets = meta.get("nets")
-            if isinstance(nets, (list, tuple)) and nets:
-                try:
-                    data["label"] = ",".join(str(x) for x in nets)
-                except Exception:
-                    data["label"] = str(nets)
-            else:
-                data["label"] = ""
-        if "kind" not in data:
-            data["kind"] = "edge"
+    edge_defaults = {}
+    for edge, data in edge_items:
+        missing = _missing_edge_attrs(data)
+        if missing:
+            edge_defaults[edge] = missing
+    if edge_defaults:
+        nx.set_edge_attributes(G, edge_defaults)
 
     return G
 
 
+def _missing_edge_attrs(data: dict) -> dict:
+    missing = {}
+    meta = data.get("meta")
+    if meta is None:
+        meta = missing["meta"] = {}
+    if "label" not in data:
+        # try to derive from meta['nets'] if present
+        nets = meta.get("nets")
+        if isinstance(nets, (list, tuple)) and nets:
+            try:
+                missing["label"] = ",".join(str(x) for x in nets)
+            except Exception:
+                missing["label"] = str(nets)
+        else:
+            missing["label"] = ""
+    if "kind" not in data:
+        missing["kind"] = "edge"
+    return missing
+
+
+def _has_contract_attrs(data: dict) -> bool:
+    label = data.get("label")
+    kind = data.get("kind")
+    meta = data.get("meta")
+    # exact str types are the common case and skip isinstance(); str
+    # subclasses still pass through the second check
+    if type(label) is str and label and type(kind) is str and type(meta) is dict:
+        return True
+    return (
+        isinstance(label, str)
+        and label != ""
+        and isinstance(kind, str)
+        and isinstance(meta, dict)
+    )
+
+
+def is_valid_graph_contract(G: nx.Graph) -> bool:
+    """
+    Fast check of the graph contract (see validate_graph_contract) that builds
+    no error messages. Use explain_graph_contract_violation to find out why a
+    graph failed.
+    """
+    for _, data in G.nodes(data=True):
+        if not _has_contract_attrs(data):
+            return False
+    # edge keys are not needed here, so plain edges(data=True) serves both
+    # Graph and MultiGraph
+    for _, _, data in G.edges(data=True):
+        if not _has_contract_attrs(data):
+            return False
+    return True
+
+
+def explain_graph_contract_violation(G: nx.Graph) -> Optional[str]:
+    """
+    Describe the first node or edge breaking the graph contract, or return
+    None if the graph is valid.
+    """
+    for n, data in G.nodes(data=True):
+        if not _has_contract_attrs(data):
+            return _describe_contract_violation(f"Node {n!r}", data)
+    for u, v, k, data in _iter_edges_with_data(G):
+        if not _has_contract_attrs(data):
+            return _describe_contract_violation(f"Edge {(u, v, k)!r}", data)
+    return None
+
+
 def validate_graph_contract(G: nx.Graph) -> Tuple[bool, str]:
     """
     Validate the graph contract *without* mutating the graph.
@@ -205,26 +397,16 @@ def validate_graph_contract(G: nx.Graph) -> Tuple[bool, str]:
     Note: This is a stricter check than normalize_graph_contract. Call normalize_graph_contract
     first if you want defaults to be added.
     """
-    # nodes
-    for n, data in G.nodes(data=True):
-        if "label" not in data:
-            return False, f"Node {n!r} missing 'label'"
-        if not isinstance(data["label"], str) or data["label"] == "":
-            return False, f"Node {n!r} has empty or non-string 'label'"
-        if "kind" not in data or not isinstance(data["kind"], str):
-            return False, f"Node {n!r} missing or invalid 'kind'"
-        if "meta" not in data or not isinstance(data["meta"], dict):
-            return False, f"Node {n!r} missing or invalid 'meta'"
-
-    # edges
-    for u, v, k, data in _iter_edges_with_data(G):
-        if "label" not in data:
-            return False, f"Edge {(u, v, k)!r} missing 'label'"
-        if not isinstance(data["label"], str) or data["label"] == "":
-            return False, f"Edge {(u, v, k)!r} has empty or non-string 'label'"
-        if "kind" not in data or not isinstance(data["kind"], str):
-            return False, f"Edge {(u, v, k)!r} missing or invalid 'kind'"
-        if "meta" not in data or not isinstance(data["meta"], dict):
-            return False, f"Edge {(u, v, k)!r} missing or invalid 'meta'"
-
-    return True, "ok"
+    if is_valid_graph_contract(G):
+        return True, "ok"
+    return False, explain_graph_contract_violation(G)
+
+
+def _describe_contract_violation(what: str, data: dict) -> str:
+    if "label" not in data:
+        return f"{what} missing 'label'"
+    if not isinstance(data["label"], str) or data["label"] == "":
+        return f"{what} has empty or non-string 'label'"
+    if "kind" not in data or not isinstance(data["kind"], str):
+        return f"{what} missing or invalid 'kind'"
+    return f"{what} missing or invalid 'meta'"
@@ -1,71 +1,107 @@
 from __future__ import annotations
 
-from typing import Optional
+import weakref
+from typing import Iterable, Optional, Tuple, Union
 
-import matplotlib.pyplot as plt
 import networkx as nx
 
 from graph.networkx_utils import build_net_multigraph_from_vertices
+from schematic_visualization.component_graph_conversion import (
+    build_component_centric_graph,
+)
+
+# Planar layouts stop being legible well before planarity testing gets cheap;
+# above this many nodes go straight to the spring layout
+PLANARITY_THRESHOLD = 40
+
+# Planarity results per graph, tagged with the (nodes, edges) counts they were
+# computed for so a graph that grew since the last render is re-tested. Weak
+# keys keep the cache from holding graphs alive or touching the caller's G.graph
+_planarity_cache: "weakref.WeakKeyDictionary[nx.Graph, Tuple[int, int, bool]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _is_planar(G: nx.Graph) -> bool:
+    size = (G.number_of_nodes(), G.number_of_edges())
+    cached = _planarity_cache.get(G)
+    if cached is not None and cached[:2] == size:
+        return cached[2]
+    try:
+        is_planar, _ = nx.check_planarity(G)
+    except nx.NetworkXException:
+        is_planar = False
+    _planarity_cache[G] = (*size, is_planar)
+    return is_planar
 
 
 def _draw_net_multigraph(G: nx.MultiGraph, *, save_path: Optional[str]) -> None:
     """
     Draw a net-projected MultiGraph: nodes are nets, edges are components (annotated).
-    Uses a force layout; if planar, uses planar_layout by request.
+    Uses a force layout; if planar (and small enough to be worth testing), uses
+    planar_layout by request.
     """
-    # Choose layout: favor planar_layout when graph is planar
+    # matplotlib (and its backend) is only loaded once something is drawn, so
+    # importing this module to build graphs stays cheap
+    import matplotlib.pyplot as plt
+
+    # Choose layout: favor planar_layout when a small graph is planar. The
+    # planarity result is cached per graph so re-renders skip the test.
     pos = None
-    try:
-        is_planar, _ = nx.check_planarity(G)
-        if is_planar:
+    if G.number_of_nodes() <= PLANARITY_THRESHOLD and _is_planar(G):
+        try:
             pos = nx.planar_layout(G)
-    except Exception:
-        pos = None
+        except nx.NetworkXException:
+            pos = None
 
     if pos is None:
-        pos = nx.spring_layout(G, k=0.8)
+        # Fixed seed keeps renders of the same graph reproducible
+        pos = nx.spring_layout(G, k=0.8, seed=0)
 
     fig, ax = plt.subplots(figsize=(10, 6))
 
     nx.draw_networkx_nodes(G, pos, node_color="#8ecae6", node_size=1000, ax=ax)
     nx.draw_networkx_edges(G, pos, ax=ax)
 
-    nx.draw_networkx_labels(G, pos, font_size=9, ax=ax)
+    # Prefer the contract 'label' attribute so graphs keyed by ids still show names
+    node_labels = {n: data.get("label", n) for n, data in G.nodes(data=True)}
+    nx.draw_networkx_labels(G, pos, labels=node_labels, font_size=9, ax=ax)
 
     # Annotate edges with rich labels including component name + pin_map (which pin(s) attach to each net)
-    # For MultiGraph get_edge_attributes returns dict keyed (u,v,key)
-    edge_labels = nx.get_edge_attributes(G, "component_name")
-    if edge_labels:
-        # Build a mapping (u,v) -> [label_for_each_parallel_edge]
-        consolidated = {}
-
-        # Iterate over all edges with data to access pin_map and component_name together
-        for u, v, key, data in G.edges(keys=True, data=True):
-            comp_name = data.get("component_name", str(data.get("component", "")))
+    # Single pass over the edges: build a mapping (u,v) -> [label_for_each_parallel_edge],
+    # skipping edges that carry no component information
+    consolidated = {}
+    for u, v, key, data in G.edges(keys=True, data=True):
+        comp_name = data.get("component_name")
+        if comp_name is None:
+            component = data.get("component")
+            if component is None:
+                continue
+            comp_name = str(component)
+
+        # build_net_multigraph_from_vertices(include_pin_label=True) pre-renders
+        # the pin map as 'pin_label'; other graphs get it stringified here
+        pins_text = data.get("pin_label")
+        if pins_text is None:
             pin_map = data.get("pin_map")  # expected: { net_name: frozenset([...]) }
-
             if pin_map:
                 # Create short "net:pinlist" pieces sorted by net name for determinism
-                parts = []
-                for net_name in sorted(pin_map.keys()):
-                    pins = sorted(map(int, pin_map[net_name]))
-                    pins_str = ",".join(str(p) for p in pins)
-                    parts.append(f"{net_name}:{pins_str}")
-                label = f"{comp_name} ({'; '.join(parts)})"
-            else:
-                # Fallback to just the component name
-                label = comp_name
-
-            # Use unordered key (u,v) so both directions map to same edge label location
-            edge_key = (u, v)
-            consolidated.setdefault(edge_key, []).append(label)
+                pins_text = "; ".join(
+                    f"{net_name}:{','.join(map(str, sorted(map(int, pin_map[net_name]))))}"
+                    for net_name in sorted(pin_map)
+                )
 
-        # Turn lists of parallel-edge labels into a single string per (u,v)
-        consolidated = {k: "\n".join(v) for k, v in consolidated.items()}
+        # Fallback to just the component name
+        label = f"{comp_name} ({pins_text})" if pins_text else comp_name
 
-        # Draw labels
+        # Use unordered key (u,v) so both directions map to same edge label location
+        consolidated.setdefault((u, v), []).append(label)
+
+    if consolidated:
+        # Turn lists of parallel-edge labels into a single string per (u,v)
+        edge_labels = {k: "\n".join(v) for k, v in consolidated.items()}
         nx.draw_networkx_edge_labels(
-            G, pos, edge_labels=consolidated, font_size=8, ax=ax
+            G, pos, edge_labels=edge_labels, font_size=8, ax=ax
         )
 
     ax.set_axis_off()
@@ -76,14 +112,6 @@ def _draw_net_multigraph(G: nx.MultiGraph, *, save_path: Optional[str]) -> None:
         print(f"Saved net-graph visualization to {save_path}")
 
 
-from typing import Iterable, Union
-
-# import your builders / drawing helpers
-from schematic_visualization.component_graph_conversion import (
-    build_component_centric_graph,
-)
-
-
 def visualize_schematic(
     vertices_or_graph: Union[Iterable, nx.Graph],
     *,
@@ -108,7 +136,9 @@ def visualize_schematic(
         if view == "components":
             G = build_component_centric_graph(vertices_or_graph)
         else:
-            G = build_net_multigraph_from_vertices(vertices_or_graph)
+            G = build_net_multigraph_from_vertices(
+                vertices_or_graph, include_pin_label=True
+            )
     # -------------------------
 
     # draw using your existing drawing function (which expects a networkx graph)
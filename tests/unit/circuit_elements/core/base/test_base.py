@@ -9,9 +9,24 @@ from circuit_elements.core.base.schematic import Schematic
 
 
 class DummyComponent(BaseComponent):
-    @property
-    def type(self) -> ComponentType:
-        return ComponentType.IC
+    type = ComponentType.IC
+
+
+# Shared, never-mutated objects for the read-only tests; tests that connect
+# anything build their own
+@pytest.fixture(scope="module")
+def ro_component() -> DummyComponent:
+    return DummyComponent("X1", ["A", "B", "C"])
+
+
+@pytest.fixture(scope="module")
+def ro_net() -> Net:
+    return Net("N1")
+
+
+@pytest.fixture(scope="module")
+def ro_ground() -> Net:
+    return Net("GND", is_ground=True)
 
 
 # ─────────────────────────────────────────────
@@ -19,44 +34,98 @@ class DummyComponent(BaseComponent):
 # ─────────────────────────────────────────────
 
 
-def test_component_requires_at_least_one_pin():
-    with pytest.raises(ValueError):
-        DummyComponent("X1", [])
+def _connect_same_pin_twice():
+    c = DummyComponent("X1", ["A"])
+    Net("N1").connect(c, "A")
+    Net("N2").connect(c, "A")
 
 
-def test_component_creates_named_pins():
-    c = DummyComponent("X1", ["A", "B", "C"])
+def _connect_pins_with_unregistered_component():
+    sch = Schematic()
+    a = DummyComponent("R1", ["1", "2"])
+    b = DummyComponent("R2", ["1", "2"])
+    sch.add_component(a)
+    # do not add b
+    sch.connect_pins(a, "1", b, "1")
+
+
+@pytest.mark.parametrize(
+    "action, expected_exc",
+    [
+        pytest.param(lambda: DummyComponent("X1", []), ValueError, id="no-pins"),
+        pytest.param(
+            lambda: DummyComponent("X1", ["A", "A"]), ValueError, id="duplicate-pins"
+        ),
+        pytest.param(
+            lambda: DummyComponent("X1", ["A", "B"]).pin("C"),
+            KeyError,
+            id="unknown-pin-name",
+        ),
+        pytest.param(
+            lambda: Net("N1").connect(DummyComponent("X1", ["A", "B"]), 10),
+            IndexError,
+            id="pin-index-out-of-range",
+        ),
+        pytest.param(_connect_same_pin_twice, ValueError, id="pin-connected-twice"),
+        pytest.param(
+            _connect_pins_with_unregistered_component,
+            KeyError,
+            id="unregistered-component",
+        ),
+    ],
+)
+def test_invalid_operations_raise(action, expected_exc):
+    with pytest.raises(expected_exc):
+        action()
+
+
+def test_component_creates_named_pins(ro_component):
+    c = ro_component
 
     assert [p.name for p in c.pins] == ["A", "B", "C"]
     assert [p.index for p in c.pins] == [0, 1, 2]
+    assert c.pin_names == ("A", "B", "C")
+
 
+def test_class_level_pin_layout_is_shared_and_validated_once():
+    class Fixed(BaseComponent):
+        type = ComponentType.IC
+        _PIN_NAMES = ("A", "B")
+
+    a = Fixed("X1")
+    b = Fixed("X2")
+    assert [p.name for p in a.pins] == ["A", "B"]
+    assert a._pin_names is b._pin_names
 
-def test_duplicate_pin_names_are_rejected():
     with pytest.raises(ValueError):
-        DummyComponent("X1", ["A", "A"])
 
+        class Duplicated(BaseComponent):
+            type = ComponentType.IC
+            _PIN_NAMES = ("A", "A")
 
-def test_pin_lookup_by_name():
-    c = DummyComponent("X1", ["D", "S", "G"])
-    assert c.pin("G") is c.pins[2]
 
+def test_pin_lookup_by_name(ro_component):
+    c = ro_component
+    assert c.pin("C") == c.pins[2]
 
-def test_pin_lookup_invalid_name():
-    c = DummyComponent("X1", ["A", "B"])
-    with pytest.raises(KeyError):
-        c.pin("C")
 
+def test_pin_index_resolves_names_and_indices(ro_component):
+    c = ro_component
+    assert [c.pin_index(p) for p in ("A", "B", "C")] == [0, 1, 2]
+    assert [c.pin_index(i) for i in range(3)] == [0, 1, 2]
+    with pytest.raises(IndexError):
+        c.pin_index(-1)
 
-def test_net_initial_state():
-    n = Net("N1")
+
+def test_net_initial_state(ro_net):
+    n = ro_net
     assert n.degree == 0
     assert n.connections == {}
     assert n.is_ground is False
 
 
-def test_ground_net_flag():
-    gnd = Net("GND", is_ground=True)
-    assert gnd.is_ground is True
+def test_ground_net_flag(ro_ground):
+    assert ro_ground.is_ground is True
 
 
 def test_connect_by_pin_index():
@@ -86,22 +155,6 @@ def test_iadd_operator():
     assert n.degree == 1
 
 
-def test_cannot_connect_same_pin_twice():
-    c = DummyComponent("X1", ["A"])
-    n1 = Net("N1")
-    n2 = Net("N2")
-    n1.connect(c, "A")
-    with pytest.raises(ValueError):
-        n2.connect(c, "A")
-
-
-def test_invalid_pin_index():
-    c = DummyComponent("X1", ["A", "B"])
-    n = Net("N1")
-    with pytest.raises(IndexError):
-        n.connect(c, 10)
-
-
 def test_multiple_pins_same_component_same_net():
     c = DummyComponent("X1", ["A", "B", "C"])
     n = Net("N1")
@@ -122,28 +175,71 @@ def test_connections_are_read_only_snapshot():
         snapshot[c].add(1)
 
 
+def test_connections_view_tracks_new_connections():
+    c = DummyComponent("X1", ["A", "B"])
+    n = Net("N1")
+    n.connect(c, "A")
+    assert n.connections == {c: frozenset({0})}
+    n.connect(c, "B")
+    assert n.connections == {c: frozenset({0, 1})}
+    assert list(n.iter_connections()) == [(c, 0), (c, 1)]
+
+
 def test_component_connected_nets():
     c = DummyComponent("X1", ["A", "B"])
     n1 = Net("N1")
     n2 = Net("N2")
     n1.connect(c, "A")
     n2.connect(c, "B")
-    nets = list(c.connected_nets())
-    assert set(nets) == {n1, n2}
+    assert c.connected_nets() == {n1, n2}
 
 
-def test_component_type_is_enum():
-    c = DummyComponent("X1", ["A"])
+def test_component_connected_nets_are_unique():
+    c = DummyComponent("X1", ["A", "B", "C"])
+    n = Net("N1")
+    n.connect(c, "A")
+    n.connect(c, "B")
+    assert c.connected_nets() == frozenset({n})
+
+
+def test_components_and_nets_hash_by_identity():
+    a = DummyComponent("X1", ["A"])
+    b = DummyComponent("X1", ["A"])
+    n1 = Net("N1")
+    n2 = Net("N1")
+    assert a != b and hash(a) != hash(b)
+    assert n1 != n2 and hash(n1) != hash(n2)
+    assert len({a, b, n1, n2}) == 4
+
+
+def test_component_type_is_enum(ro_component):
+    c = ro_component
     assert isinstance(c.type, ComponentType)
     assert c.type is ComponentType.IC
 
 
-def test_repr_does_not_crash():
+def test_component_without_type_is_rejected():
+    with pytest.raises(TypeError):
+
+        class Untyped(BaseComponent):
+            pass
+
+
+def test_reprs_are_short_summaries():
+    c = DummyComponent("X1", ["A", "B"])
+    n = Net("N1")
+    n.connect(c, "A")
+    assert repr(c) == "<DummyComponent X1>"
+    assert repr(n) == "<Net N1 degree=1>"
+    assert [repr(p) for p in c.pins] == ["<Pin A -> N1>", "<Pin B -> NC>"]
+
+
+def test_describe_lists_pin_and_connection_state():
     c = DummyComponent("X1", ["A", "B"])
     n = Net("N1")
     n.connect(c, "A")
-    assert isinstance(repr(c), str)
-    assert isinstance(repr(n), str)
+    assert c.describe() == "<DummyComponent X1 [0:N1, 1:NC]>"
+    assert n.describe() == "<Net N1 degree=1 [X1:[0]]>"
 
 
 # ─────────────────────────────────────────────
@@ -151,13 +247,20 @@ def test_repr_does_not_crash():
 # ─────────────────────────────────────────────
 
 
-def test_connect_pins_creates_auto_net_when_both_unconnected():
+@pytest.fixture
+def two_resistor_sch() -> tuple[Schematic, DummyComponent, DummyComponent]:
+    """Fresh schematic holding two registered 2-pin parts R1 and R2 (tests mutate it)"""
     sch = Schematic()
     a = DummyComponent("R1", ["1", "2"])
     b = DummyComponent("R2", ["1", "2"])
 
     sch.add_component(a)
     sch.add_component(b)
+    return sch, a, b
+
+
+def test_connect_pins_creates_auto_net_when_both_unconnected(two_resistor_sch):
+    sch, a, b = two_resistor_sch
 
     net = sch.connect_pins(a, "2", b, "1")  # object args
     assert net is not None
@@ -169,13 +272,10 @@ def test_connect_pins_creates_auto_net_when_both_unconnected():
     assert b.pin("1").net is net
 
 
-def test_connect_pins_accepts_names_and_objects_and_attaches_to_existing_net():
-    sch = Schematic()
-    a = DummyComponent("R1", ["1", "2"])
-    b = DummyComponent("R2", ["1", "2"])
-
-    sch.add_component(a)
-    sch.add_component(b)
+def test_connect_pins_accepts_names_and_objects_and_attaches_to_existing_net(
+    two_resistor_sch,
+):
+    sch, a, b = two_resistor_sch
     # create a named net first
     sch.add_net(Net("VCC"))
     sch.connect("VCC", "R1", "1")  # connect by names
@@ -186,13 +286,8 @@ def test_connect_pins_accepts_names_and_objects_and_attaches_to_existing_net():
     assert b.pin("2").net is net
 
 
-def test_connect_pins_requires_explicit_merge_for_different_nets():
-    sch = Schematic()
-    a = DummyComponent("R1", ["1", "2"])
-    b = DummyComponent("R2", ["1", "2"])
-
-    sch.add_component(a)
-    sch.add_component(b)
+def test_connect_pins_requires_explicit_merge_for_different_nets(two_resistor_sch):
+    sch, a, b = two_resistor_sch
 
     sch.add_net(Net("N_A"))
     sch.add_net(Net("N_B"))
@@ -214,6 +309,23 @@ def test_connect_pins_requires_explicit_merge_for_different_nets():
     assert merged_net.name in {n.name for n in sch.nets}
 
 
+def test_merge_nets_carries_degree_over(two_resistor_sch):
+    sch, a, b = two_resistor_sch
+
+    sch.add_net(Net("N_A"))
+    sch.add_net(Net("N_B"))
+
+    sch.connect("N_A", "R1", "1")
+    sch.connect("N_A", "R1", "2")
+    sch.connect("N_B", "R2", "1")
+
+    merged_net = sch.connect_pins("R1", "1", "R2", "1", allow_merge=True)
+
+    assert merged_net.degree == 3
+    assert merged_net.connections == {a: frozenset({0, 1}), b: frozenset({0})}
+    assert "N_B" not in {n.name for n in sch.nets}
+
+
 def test_connect_create_net_convenience_and_duplicate_net_error():
     sch = Schematic()
     c = DummyComponent("X1", ["A"])
@@ -228,11 +340,15 @@ def test_connect_create_net_convenience_and_duplicate_net_error():
         sch.add_net(Net("AUTO1"))
 
 
-def test_connect_pins_unregistered_component_raises():
+def test_validate_reports_first_unconnected_pin():
     sch = Schematic()
-    a = DummyComponent("R1", ["1", "2"])
-    b = DummyComponent("R2", ["1", "2"])
-    sch.add_component(a)
-    # do not add b
-    with pytest.raises(KeyError):
-        sch.connect_pins(a, "1", b, "1")
+    c = DummyComponent("X1", ["A", "B", "C"])
+    sch.add_component(c)
+    sch.connect_create_net("N1", "X1", "A")
+
+    with pytest.raises(ValueError, match="unconnected pin 'B'"):
+        sch.validate()
+
+    sch.connect_create_net("N1", "X1", "B")
+    sch.connect_create_net("N1", "X1", "C")
+    sch.validate()
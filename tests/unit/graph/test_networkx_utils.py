@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import networkx as nx
+import pytest
 
 from graph.networkx_utils import (
     build_bipartite_graph_from_vertices,
+    build_net_graph_from_vertices,
     build_net_multigraph_from_vertices,
 )
 
@@ -34,46 +36,113 @@ class FakeNet:
         self.connections: dict[FakeComponent, frozenset[int]] = {}
 
     def connect(self, comp: FakeComponent, *pin_indices: int):
-        """Convenience helper for tests to populate .connections"""
-        s = set(self.connections.get(comp, frozenset()))
-        for idx in pin_indices:
-            s.add(int(idx))
-        self.connections[comp] = frozenset(s)
+        """
+        Convenience helper for tests to populate .connections; pass every pin
+        of a component on this net in one call to build its frozenset once.
+        """
+        self.connections[comp] = self.connections.get(comp, frozenset()) | frozenset(
+            map(int, pin_indices)
+        )
 
     def __repr__(self):
         return f"<FakeNet {self.name}>"
 
 
 # -------------------------
-# Tests for bipartite builder
+# Canonical topologies, built once per module; tests only read them
 # -------------------------
 
 
-def test_bipartite_graph_nodes_and_kinds_using_fakes():
+@pytest.fixture(scope="module")
+def bipartite_simple() -> tuple[nx.MultiGraph, FakeNet, FakeComponent]:
+    """N1 -- C1 -- N2 (one pin per net) plus isolated N3; returns (G, n1, comp)"""
     n1 = FakeNet("N1")
     n2 = FakeNet("N2")
+    n3 = FakeNet("N3")  # isolated net, no connections
     comp = FakeComponent("C1")
 
     n1.connect(comp, 0)
     n2.connect(comp, 1)
 
-    G = build_bipartite_graph_from_vertices([n1, n2])
-
-    assert set(G.nodes) == {"N1", "N2", "C1"}
-    assert G.nodes["N1"]["kind"] == "net"
-    assert G.nodes["N2"]["kind"] == "net"
-    assert G.nodes["C1"]["kind"] == "component"
+    return build_bipartite_graph_from_vertices([n1, n2, n3]), n1, comp
 
 
-def test_bipartite_graph_edges_have_pin_index_using_fakes():
+@pytest.fixture(scope="module")
+def bipartite_multi_pin() -> nx.MultiGraph:
+    """Two pins of C1 attached to the same net N1"""
     n1 = FakeNet("N1")
     comp = FakeComponent("C1")
 
-    n1.connect(comp, 0)
+    n1.connect(comp, 0, 1)
+
+    return build_bipartite_graph_from_vertices([n1])
+
+
+@pytest.fixture(scope="module")
+def net_mg_two_pin() -> tuple[nx.MultiGraph, FakeComponent]:
+    """VCC -- R1 -- GND; returns (MG, r1)"""
+    vcc = FakeNet("VCC")
+    gnd = FakeNet("GND")
+    r1 = FakeComponent("R1")
+
+    vcc.connect(r1, 0)
+    gnd.connect(r1, 1)
 
-    G = build_bipartite_graph_from_vertices([n1])
+    return build_net_multigraph_from_vertices([vcc, gnd]), r1
 
-    edges = list(G.edges(data=True))
+
+@pytest.fixture(scope="module")
+def net_mg_three_pin() -> nx.MultiGraph:
+    """U1 with one pin on each of N1, N2, N3"""
+    n1 = FakeNet("N1")
+    n2 = FakeNet("N2")
+    n3 = FakeNet("N3")
+
+    u1 = FakeComponent("U1")
+
+    n1.connect(u1, 0)
+    n2.connect(u1, 1)
+    n3.connect(u1, 2)
+
+    return build_net_multigraph_from_vertices([n1, n2, n3])
+
+
+@pytest.fixture(scope="module")
+def net_mg_parallel() -> nx.MultiGraph:
+    """R1 and R2 both between N1 and N2"""
+    n1 = FakeNet("N1")
+    n2 = FakeNet("N2")
+
+    r1 = FakeComponent("R1")
+    r2 = FakeComponent("R2")
+
+    n1.connect(r1, 0)
+    n2.connect(r1, 1)
+
+    n1.connect(r2, 0)
+    n2.connect(r2, 1)
+
+    return build_net_multigraph_from_vertices([n1, n2])
+
+
+# -------------------------
+# Tests for bipartite builder
+# -------------------------
+
+
+def test_bipartite_graph_nodes_and_kinds_using_fakes(bipartite_simple):
+    G, _, _ = bipartite_simple
+
+    assert set(G.nodes) == {"N1", "N2", "N3", "C1"}
+    assert G.nodes["N1"]["kind"] == "net"
+    assert G.nodes["N2"]["kind"] == "net"
+    assert G.nodes["C1"]["kind"] == "component"
+
+
+def test_bipartite_graph_edges_have_pin_index_using_fakes(bipartite_simple):
+    G, n1, comp = bipartite_simple
+
+    edges = list(G.edges("N1", data=True))
     assert len(edges) == 1
 
     u, v, data = edges[0]
@@ -84,28 +153,20 @@ def test_bipartite_graph_edges_have_pin_index_using_fakes():
     assert data["comp_obj"] is comp
 
 
-def test_bipartite_allows_multiple_edges_same_net_component_using_fakes():
-    n1 = FakeNet("N1")
-    comp = FakeComponent("C1")
-
-    # two different pins of the same component attached to the same net
-    n1.connect(comp, 0)
-    n1.connect(comp, 1)
-
-    G = build_bipartite_graph_from_vertices([n1])
+def test_bipartite_allows_multiple_edges_same_net_component_using_fakes(
+    bipartite_multi_pin,
+):
+    G = bipartite_multi_pin
 
     assert isinstance(G, nx.MultiGraph)
     assert G.number_of_edges("N1", "C1") == 2
 
 
-def test_bipartite_includes_isolated_net_using_fakes():
-    n1 = FakeNet("N1")
-    n2 = FakeNet("N2")  # isolated net, no connections
-
-    G = build_bipartite_graph_from_vertices([n1, n2])
+def test_bipartite_includes_isolated_net_using_fakes(bipartite_simple):
+    G, _, _ = bipartite_simple
 
-    assert "N2" in G.nodes
-    assert G.degree("N2") == 0
+    assert G.nodes["N3"]["kind"] == "net"
+    assert G.degree("N3") == 0
 
 
 # -------------------------
@@ -113,15 +174,8 @@ def test_bipartite_includes_isolated_net_using_fakes():
 # -------------------------
 
 
-def test_net_multigraph_simple_two_pin_component_using_fakes():
-    vcc = FakeNet("VCC")
-    gnd = FakeNet("GND")
-    r1 = FakeComponent("R1")
-
-    vcc.connect(r1, 0)
-    gnd.connect(r1, 1)
-
-    MG = build_net_multigraph_from_vertices([vcc, gnd])
+def test_net_multigraph_simple_two_pin_component_using_fakes(net_mg_two_pin):
+    MG, r1 = net_mg_two_pin
 
     assert isinstance(MG, nx.MultiGraph)
     assert set(MG.nodes) == {"VCC", "GND"}
@@ -133,20 +187,30 @@ def test_net_multigraph_simple_two_pin_component_using_fakes():
     assert edge_data["component_name"] == "R1"
     assert edge_data["nets"] == ("VCC", "GND")
     assert "pin_map" in edge_data and "VCC" in edge_data["pin_map"]
+    # the rendered pin label is opt-in
+    assert "pin_label" not in edge_data
 
 
-def test_net_multigraph_component_with_more_than_two_pins_using_fakes():
-    n1 = FakeNet("N1")
-    n2 = FakeNet("N2")
-    n3 = FakeNet("N3")
-
+def test_net_multigraph_renders_pin_label_on_request_using_fakes():
+    vcc = FakeNet("VCC")
+    gnd = FakeNet("GND")
     u1 = FakeComponent("U1")
 
-    n1.connect(u1, 0)
-    n2.connect(u1, 1)
-    n3.connect(u1, 2)
+    vcc.connect(u1, 0)
+    gnd.connect(u1, 2)
+    gnd.connect(u1, 1)
+
+    MG = build_net_multigraph_from_vertices([vcc, gnd], include_pin_label=True)
+
+    edge_data = list(MG.edges(data=True))[0][2]
+    assert edge_data["pin_map"] == {"VCC": frozenset({0}), "GND": frozenset({1, 2})}
+    assert edge_data["pin_label"] == "GND:1,2; VCC:0"
+
 
-    MG = build_net_multigraph_from_vertices([n1, n2, n3])
+def test_net_multigraph_component_with_more_than_two_pins_using_fakes(
+    net_mg_three_pin,
+):
+    MG = net_mg_three_pin
 
     # for three nets, we expect 3 unordered pairs (3 edges)
     assert MG.number_of_edges() == 3
@@ -161,20 +225,10 @@ def test_net_multigraph_component_with_more_than_two_pins_using_fakes():
     assert actual_pairs == expected_pairs
 
 
-def test_net_multigraph_parallel_edges_for_multiple_components_using_fakes():
-    n1 = FakeNet("N1")
-    n2 = FakeNet("N2")
-
-    r1 = FakeComponent("R1")
-    r2 = FakeComponent("R2")
-
-    n1.connect(r1, 0)
-    n2.connect(r1, 1)
-
-    n1.connect(r2, 0)
-    n2.connect(r2, 1)
-
-    MG = build_net_multigraph_from_vertices([n1, n2])
+def test_net_multigraph_parallel_edges_for_multiple_components_using_fakes(
+    net_mg_parallel,
+):
+    MG = net_mg_parallel
 
     assert MG.number_of_edges("N1", "N2") == 2
 
@@ -193,3 +247,38 @@ def test_net_multigraph_ignores_single_net_components_using_fakes():
     # no edges should be created because the single-pin component touches only one net
     assert MG.number_of_edges() == 0
     assert "N1" in MG.nodes
+
+
+# -------------------------
+# Tests for plain net graph builder
+# -------------------------
+
+
+def test_net_graph_matches_multigraph_topology_using_fakes():
+    n1 = FakeNet("N1")
+    n2 = FakeNet("N2")
+    n3 = FakeNet("N3")
+    n4 = FakeNet("N4")  # isolated net
+
+    u1 = FakeComponent("U1")
+    r1 = FakeComponent("R1")
+    r2 = FakeComponent("R2")
+
+    n1.connect(u1, 0)
+    n2.connect(u1, 1)
+    n3.connect(u1, 2)
+
+    # two parallel resistors between N1 and N2 collapse into one edge
+    n1.connect(r1, 0)
+    n2.connect(r1, 1)
+    n1.connect(r2, 0)
+    n2.connect(r2, 1)
+
+    G = build_net_graph_from_vertices([n1, n2, n3, n4])
+    MG = build_net_multigraph_from_vertices([n1, n2, n3, n4])
+
+    assert type(G) is nx.Graph
+    assert set(G.nodes) == set(MG.nodes)
+    assert {frozenset(e) for e in G.edges()} == {frozenset(e) for e in MG.edges()}
+    assert G.number_of_edges() == 3
+    assert G.degree("N4") == 0
@@ -1,32 +1,38 @@
 from __future__ import annotations
 
-from itertools import combinations
-
+import networkx as nx
+import numpy as np
 import pytest
 
 from circuit_elements.core.base.base_component import BaseComponent
 from circuit_elements.core.base.component_type import ComponentType
 from circuit_elements.core.base.net import Net
 from circuit_elements.core.base.schematic import Schematic
+from graph.networkx_utils import (
+    build_bipartite_graph_from_vertices,
+    build_net_multigraph_from_vertices,
+)
+from graph.start_expansion import star_expansion_arrays, star_expansion_from_vertices
 
 
 class Resistor(BaseComponent):
+    type = ComponentType.RESISTOR
+
     def __init__(self, name: str, resistance: float):
         super().__init__(
             name=name, pin_names=["1", "2"], parameters={"resistance": resistance}
         )
 
-    @property
-    def type(self) -> ComponentType:
-        return ComponentType.RESISTOR
-
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def voltage_divider() -> tuple[Schematic, Resistor, Resistor, Net, Net, Net]:
     """
     Build a simple voltage divider:
        VCC -- R1 -- VOUT -- R2 -- GND
     Returns (schematic, r1, r2, vcc, vout, gnd)
+
+    Built once and shared by every test in this module, so tests must treat it
+    as read-only; a test that needs to mutate it should get its own fixture.
     """
     sch = Schematic()
 
@@ -48,16 +54,30 @@ def voltage_divider() -> tuple[Schematic, Resistor, Resistor, Net, Net, Net]:
     return sch, r1, r2, vcc, vout, gnd
 
 
-def test_voltage_divider_incidences(voltage_divider):
-    sch, r1, r2, vcc, vout, gnd = voltage_divider
+@pytest.fixture(scope="module")
+def vd_graphs(voltage_divider) -> tuple[nx.MultiGraph, nx.MultiGraph]:
+    """(bipartite graph, net multigraph) of the voltage divider"""
+    sch, *_ = voltage_divider
+    nets = list(sch.nets)
+    return (
+        build_bipartite_graph_from_vertices(nets),
+        build_net_multigraph_from_vertices(nets),
+    )
+
 
-    # build incidence list (net, component, pin_index)
-    incidences = []
-    for net in sch.nets:
-        for comp, pin_set in net.connections.items():
-            for pin_idx in pin_set:
-                incidences.append((net.name, comp.name, pin_idx))
+@pytest.fixture(scope="module")
+def vd_incidences(voltage_divider) -> list[tuple[str, str, int]]:
+    """Incidence list (net_name, component_name, pin_index) of the voltage divider"""
+    sch, *_ = voltage_divider
+    return [
+        (net.name, comp.name, pin_idx)
+        for net in sch.nets
+        for comp, pin_set in net.connections.items()
+        for pin_idx in pin_set
+    ]
 
+
+def test_voltage_divider_incidences(vd_incidences):
     expected = {
         ("VCC", "R1", 0),
         ("VOUT", "R1", 1),
@@ -65,47 +85,36 @@ def test_voltage_divider_incidences(voltage_divider):
         ("GND", "R2", 1),
     }
 
-    assert set(incidences) == expected
-
+    assert set(vd_incidences) == expected
 
-def test_bipartite_view(voltage_divider):
-    sch, r1, r2, vcc, vout, gnd = voltage_divider
 
-    # nodes: union of net names and component names
-    net_names = {net.name for net in sch.nets}
-    comp_names = {c.name for c in sch.components}
-    nodes = net_names.union(comp_names)
+def test_bipartite_view(vd_graphs):
+    bipartite_G, _ = vd_graphs
 
-    # edges: (net_name, comp_name, pin_index)
-    edges = []
-    for net in sch.nets:
-        for comp, pin_set in net.connections.items():
-            for pin_idx in pin_set:
-                edges.append((net.name, comp.name, pin_idx))
-
-    assert "VCC" in net_names and "VOUT" in net_names and "GND" in net_names
-    assert "R1" in comp_names and "R2" in comp_names
+    kinds = {n: data["kind"] for n, data in bipartite_G.nodes(data=True)}
+    assert kinds == {
+        "VCC": "net",
+        "VOUT": "net",
+        "GND": "net",
+        "R1": "component",
+        "R2": "component",
+    }
 
     # R1 must be adjacent to VCC and VOUT
-    r1_adj = {net for net, comp, _ in edges if comp == "R1"}
-    assert r1_adj == {"VCC", "VOUT"}
+    assert set(bipartite_G.neighbors("R1")) == {"VCC", "VOUT"}
 
     # VOUT must be adjacent to R1 and R2
-    vout_adj = {comp for net, comp, _ in edges if net == "VOUT"}
-    assert vout_adj == {"R1", "R2"}
+    assert set(bipartite_G.neighbors("VOUT")) == {"R1", "R2"}
 
 
-def test_net_to_net_pairs_projection(voltage_divider):
-    sch, r1, r2, vcc, vout, gnd = voltage_divider
+def test_net_to_net_pairs_projection(vd_graphs):
+    _, net_mg = vd_graphs
 
-    # derived net-to-net pairs per component (ordered as frozenset pairs for set equality)
-    derived_pairs = set()
-    for comp in sch.components:
-        nets = {p.net.name for p in comp.pins if p.net is not None}
-        if len(nets) < 2:
-            continue
-        for a, b in combinations(sorted(nets), 2):
-            derived_pairs.add((a, b, comp.name))
+    # net-to-net pairs per component (sorted pairs for set equality)
+    derived_pairs = {
+        (*sorted((u, v)), data["component_name"])
+        for u, v, data in net_mg.edges(data=True)
+    }
 
     expected_pairs = {
         ("VCC", "VOUT", "R1"),
@@ -115,17 +124,37 @@ def test_net_to_net_pairs_projection(voltage_divider):
     assert derived_pairs == expected_pairs
 
 
-def test_incidence_completeness_and_uniqueness(voltage_divider):
+def test_incidence_completeness_and_uniqueness(voltage_divider, vd_incidences):
     sch, r1, r2, vcc, vout, gnd = voltage_divider
 
     # every pin of every component must appear exactly once in the incidence list
-    incidences = []
-    for net in sch.nets:
-        for comp, pin_set in net.connections.items():
-            for pin_idx in pin_set:
-                incidences.append((comp.name, pin_idx))
+    incidences = [(comp_name, pin_idx) for _, comp_name, pin_idx in vd_incidences]
 
     # build set of (component_name, pin_index) for all defined component pins
     all_pins = {(c.name, p.index) for c in sch.components for p in c.pins}
 
     assert set(incidences) == all_pins
+
+
+def test_star_expansion_arrays_match_incidence_list(voltage_divider):
+    sch, r1, r2, _, _, _ = voltage_divider
+
+    v_idx, he_idx, pin_idx, vertex_list, he_list = star_expansion_arrays(sch.nets)
+
+    assert v_idx.dtype == he_idx.dtype == pin_idx.dtype == np.int32
+    assert len(v_idx) == len(he_idx) == len(pin_idx) == 4
+    assert vertex_list == list(sch.nets)
+    assert set(he_list) == {r1, r2}
+
+    columnar = [
+        (vertex_list[v], he_list[he], int(p))
+        for v, he, p in zip(v_idx, he_idx, pin_idx)
+    ]
+    assert columnar == star_expansion_from_vertices(sch.nets)
+
+
+def test_star_expansion_arrays_empty():
+    v_idx, he_idx, pin_idx, vertex_list, he_list = star_expansion_arrays([])
+
+    assert len(v_idx) == len(he_idx) == len(pin_idx) == 0
+    assert vertex_list == [] and he_list == []
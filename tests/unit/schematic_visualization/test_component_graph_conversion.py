@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import networkx as nx
+import pytest
+
+from circuit_elements.components.npn_transistor import NPNTransistor
+from circuit_elements.components.resistor import Resistor
+from circuit_elements.core.base.net import Net
+from circuit_elements.core.base.schematic import Schematic
+from schematic_visualization.component_graph_conversion import (
+    build_component_centric_graph,
+    build_component_views,
+    collect_comp_net_info,
+    convert_indices_to_pin_names,
+    explain_graph_contract_violation,
+    is_valid_graph_contract,
+    normalize_graph_contract,
+    validate_graph_contract,
+)
+
+
+@pytest.fixture
+def biased_transistor() -> tuple[Schematic, Resistor, NPNTransistor]:
+    """
+    VCC -- RB -- base(Q1); collector and emitter of Q1 both tied to GND
+    """
+    sch = Schematic()
+
+    rb = Resistor("RB", 10_000)
+    q1 = NPNTransistor("Q1", 100.0, part_number=None)
+
+    sch.add_component(rb)
+    sch.add_component(q1)
+
+    sch.connect_create_net("VCC", "RB", "1")
+    sch.connect_create_net("BASE", "RB", "2")
+    sch.connect_create_net("BASE", "Q1", "base")
+    sch.connect_create_net("GND", "Q1", "collector")
+    sch.connect_create_net("GND", "Q1", "emitter")
+    sch.add_net(Net("NC"))  # isolated net
+    return sch, rb, q1
+
+
+def test_component_views_match_two_step_conversion(biased_transistor):
+    sch, rb, q1 = biased_transistor
+
+    comp_view, net_view = build_component_views(sch.nets)
+
+    assert comp_view == convert_indices_to_pin_names(collect_comp_net_info(sch.nets))
+    assert comp_view[q1] == {"BASE": ["base"], "GND": ["collector", "emitter"]}
+    assert net_view["BASE"] == {rb: ["2"], q1: ["base"]}
+    assert net_view["NC"] == {}
+
+
+def test_collect_comp_net_info_returns_plain_dicts(biased_transistor):
+    sch, rb, q1 = biased_transistor
+
+    info = collect_comp_net_info(sch.nets)
+
+    assert type(info) is dict and type(info[q1]) is dict
+    assert info[q1] == {"BASE": {1}, "GND": {0, 2}}
+    # missing keys raise instead of silently inserting empty entries
+    with pytest.raises(KeyError):
+        info[rb]["GND"]
+    assert "GND" not in info[rb]
+
+
+def test_collect_comp_net_info_empty_inputs_match_normal_return_type():
+    # sized, generator and connection-less inputs all take the same return type
+    for vertices in ([], iter([]), [Net("N1")]):
+        info = collect_comp_net_info(vertices)
+        assert type(info) is dict and info == {}
+
+
+def test_component_centric_graph_has_one_edge_per_incidence(biased_transistor):
+    sch, _, _ = biased_transistor
+
+    G = build_component_centric_graph(sch.nets)
+
+    kinds = {data["label"]: data["kind"] for _, data in G.nodes(data=True)}
+    assert kinds == {
+        "RB": "component",
+        "Q1": "component",
+        "VCC": "net",
+        "BASE": "net",
+        "GND": "net",
+    }
+    # (RB, VCC), (RB, BASE), (Q1, BASE), (Q1, GND)
+    assert G.number_of_edges() == 4
+
+    node_id = G.graph["node_id"]
+    assert all(type(n) is int for n in G.nodes)
+    assert G.has_edge(node_id["__NET__:GND"], node_id["Q1"])
+    assert G.nodes[node_id["__NET__:GND"]]["label"] == "GND"
+
+    gnd_edges = [data for _, _, data in G.edges(data=True) if data["label"] == "GND"]
+    assert len(gnd_edges) == 1
+    assert gnd_edges[0]["meta"]["pin_map"] == {"Q1": ["collector", "emitter"]}
+
+
+def test_component_centric_graph_keeps_same_named_components_apart():
+    # Schematic rejects duplicate names, but bare nets may still carry them
+    n1 = Net("N1")
+    n2 = Net("N2")
+    r_a = Resistor("R", 1_000)
+    r_b = Resistor("R", 2_000)
+    x = Resistor("X", 3_000)
+    n1.connect(r_a, "1")
+    n2.connect(r_a, "2")
+    n1.connect(r_b, "1")
+    n2.connect(r_b, "2")
+    n1.connect(x, "1")
+
+    G = build_component_centric_graph([n1, n2])
+
+    comps = [
+        data["meta"]["obj"]
+        for _, data in G.nodes(data=True)
+        if data["kind"] == "component"
+    ]
+    assert len(comps) == 3 and {id(c) for c in comps} == {id(r_a), id(r_b), id(x)}
+    # (R, N1), (R, N2), (R, N1), (R, N2), (X, N1)
+    assert G.number_of_edges() == 5
+    assert G.degree(G.graph["node_id"]["X"]) == 1
+    # the name side table keeps the first of the duplicate ids
+    assert G.nodes[G.graph["node_id"]["R"]]["meta"]["obj"] is r_a
+
+
+def test_component_centric_graph_without_pin_names(biased_transistor):
+    sch, _, _ = biased_transistor
+
+    G = build_component_centric_graph(sch.nets, include_pin_names=False)
+
+    node_id = G.graph["node_id"]
+    gnd_edge = G.get_edge_data(node_id["__NET__:GND"], node_id["Q1"], key=0)
+    assert gnd_edge["meta"]["pin_map"] == {"Q1": [0, 2]}
+
+
+def test_normalize_graph_contract_fills_defaults_on_graph():
+    G = nx.Graph()
+    G.add_node("A")
+    G.add_node("B", label="b", kind="net", meta={"net": "B"})
+    G.add_edge("A", "B", meta={"nets": ["N1", "N2"]})
+    G.add_edge("B", 3)
+
+    assert normalize_graph_contract(G) is G
+
+    assert G.nodes["A"] == {"label": "A", "kind": "node", "meta": {}}
+    assert G.nodes["B"] == {"label": "b", "kind": "net", "meta": {"net": "B"}}
+    assert G.nodes[3] == {"label": "3", "kind": "node", "meta": {}}
+    # edge label is derived from meta['nets'] when there is one
+    assert G.edges["A", "B"] == {
+        "label": "N1,N2",
+        "kind": "edge",
+        "meta": {"nets": ["N1", "N2"]},
+    }
+    assert G.edges["B", 3] == {"label": "", "kind": "edge", "meta": {}}
+
+
+def test_normalize_graph_contract_fills_defaults_per_multigraph_edge():
+    G = nx.MultiGraph()
+    G.add_edge("A", "B", meta={"nets": ("N1",)})
+    G.add_edge("A", "B", label="keep")
+    G.add_edge("A", "B", kind="net", meta={"nets": []})
+
+    normalize_graph_contract(G)
+
+    assert G.nodes["A"] == {"label": "A", "kind": "node", "meta": {}}
+    # each parallel edge gets its own defaults, keyed by (u, v, key)
+    assert G.edges["A", "B", 0] == {
+        "label": "N1",
+        "kind": "edge",
+        "meta": {"nets": ("N1",)},
+    }
+    assert G.edges["A", "B", 1] == {"label": "keep", "kind": "edge", "meta": {}}
+    assert G.edges["A", "B", 2] == {"label": "", "kind": "net", "meta": {"nets": []}}
+
+
+def test_graph_contract_fast_check_and_explanation(biased_transistor):
+    sch, _, _ = biased_transistor
+
+    G = normalize_graph_contract(build_component_centric_graph(sch.nets))
+    assert is_valid_graph_contract(G)
+    assert explain_graph_contract_violation(G) is None
+    assert validate_graph_contract(G) == (True, "ok")
+
+    q1_id = G.graph["node_id"]["Q1"]
+    G.nodes[q1_id]["kind"] = 3
+    assert not is_valid_graph_contract(G)
+    assert (
+        explain_graph_contract_violation(G)
+        == f"Node {q1_id!r} missing or invalid 'kind'"
+    )
+    assert validate_graph_contract(G) == (
+        False,
+        f"Node {q1_id!r} missing or invalid 'kind'",
+    )